@@ -0,0 +1,69 @@
+"""
+    Module that provides fast `JSON` (de)serialization for network files
+    Uses `orjson` when it is installed and falls back to `simplejson` otherwise
+"""
+
+from typing import Any, Union
+
+import simplejson
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Deserialize a `JSON` document
+    Documents containing `NaN` or `Infinity` tokens are parsed by `simplejson`
+
+    Parameters
+    ----------
+    data : Union[bytes, str]
+        The raw `JSON` document
+
+    Returns
+    -------
+    Any
+        The deserialized python object
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return simplejson.loads(data, allow_nan=True)
+
+
+def dumps(obj: Any, indent: bool = True, sort_keys: bool = True) -> bytes:
+    """
+    Serialize an object to a `JSON` document
+    `NaN` and `Infinity` values are serialized as `null`
+
+    Parameters
+    ----------
+    obj : Any
+        The python object to be serialized
+    indent : bool
+        If True will pretty-print the document with an indent of 2 spaces
+        Default value is True
+    sort_keys : bool
+        If True will sort the keys of the dictionaries
+        Default value is True
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded `JSON` document
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return simplejson.dumps(
+        obj, indent=2 if indent else None, sort_keys=sort_keys, ignore_nan=True
+    ).encode("utf-8")
@@ -2,6 +2,7 @@
     Module that defines the `Network` object and methods to read, write and manipulate it
 """
 
+import pathlib
 from typing import Any, Dict, List, Optional, Tuple, Union
 from warnings import warn
 
@@ -11,6 +12,7 @@ import pandas as pd
 import simplejson
 from statsmodels.stats.multitest import multipletests
 
+from .. import _json
 from ..validation import (
     ChildrenmapType,
     CorrelationmatrixType,
@@ -548,6 +550,18 @@ class Network:
         )
         return network
 
+    def _json_bytes(self, pvalue_filter: bool, interaction_filter: bool) -> bytes:
+        """The UTF-8 encoded `JSON` representation of the network"""
+        nodes = {"nodes": self.nodes}
+        links = {
+            "links": self._filter_links(
+                pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
+            )
+        }
+        metadata = self.metadata
+        network = {**metadata, **nodes, **links}
+        return _json.dumps(network)
+
     def json(
         self, pvalue_filter: bool = False, interaction_filter: bool = False
     ) -> str:
@@ -568,15 +582,9 @@ class Network:
         str
             The `JSON` string representation of the network
         """
-        nodes = {"nodes": self.nodes}
-        links = {
-            "links": self._filter_links(
-                pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
-            )
-        }
-        metadata = self.metadata
-        network = {**metadata, **nodes, **links}
-        return simplejson.dumps(network, indent=2, sort_keys=True, ignore_nan=True)
+        return self._json_bytes(
+            pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
+        ).decode("utf-8")
 
     def write(
         self, fpath: str, pvalue_filter: bool = False, interaction_filter: bool = False
@@ -595,12 +603,11 @@ class Network:
             If True will use `interaction_threshold` for filtering
             Default  value is False
         """
-        with open(fpath, "w") as fid:
-            fid.write(
-                self.json(
-                    pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
-                )
+        pathlib.Path(fpath).write_bytes(
+            self._json_bytes(
+                pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
             )
+        )
 
     @classmethod
     def load_json(
@@ -625,10 +632,8 @@ class Network:
         if not raw_data and not fpath:
             raise ValueError("Either fpath or raw_data must be specified")
         if not raw_data and fpath:
-            with open(fpath, "r") as fid:
-                data = simplejson.load(fid)
-        else:
-            data = raw_data
+            return cls.load_bytes(pathlib.Path(fpath).read_bytes())
+        data = raw_data
         # Validation
         nodes_model = NodesModel({"nodes": data["nodes"]}, strict=False)
         nodes_model.validate()
@@ -685,6 +690,23 @@ class Network:
         )
         return network
 
+    @classmethod
+    def load_bytes(cls, data: bytes) -> "Network":
+        """
+        Create a `Network` object from the contents of a network `JSON` file
+
+        Parameters
+        ----------
+        data : bytes
+            The raw contents of the network `JSON` file
+
+        Returns
+        -------
+        Network
+            The instance of the `Network` class
+        """
+        return cls.load_json(raw_data=_json.loads(data))
+
     @classmethod
     def load_elist(
         cls,
@@ -5,15 +5,16 @@
 import pathlib
 from collections import Counter, defaultdict
 from collections.abc import Collection
+from functools import cached_property
 from itertools import product
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 
 import networkx as nx
 import numpy as np
 import pandas as pd
-import simplejson
-from scipy.stats import chi2, pearsonr
+from scipy.stats import chi2
 
+from .. import _json
 from .network import Network
 
 DType = List[Dict[str, Any]]
@@ -191,6 +192,11 @@ class NetworkGroup(Collection):
         """The contexts for the group of networks"""
         return self.graph.graph["contexts"]
 
+    @cached_property
+    def cids(self) -> Tuple[int, ...]:
+        """The context ids of the networks in the group"""
+        return tuple(range(len(self.contexts)))
+
     def get_adjacency_vectors(self, key: str) -> pd.DataFrame:
         """
         Returns the adjacency matrix for each context as a `pd.DataFrame`
@@ -206,25 +212,16 @@ class NetworkGroup(Collection):
             The DataFrame containing adjacency vectors as columns
         """
         ids = list(self.graph.nodes)
-        size = len(ids) * len(ids)
+        n_ids = len(ids)
+        id_index = {id_: i for i, id_ in enumerate(ids)}
         # NOTE: This will consider id1-id2 and id2-id1 as different (even for undirected)
         index = [f"{id1}-{id2}" for id1, id2 in product(ids, repeat=2)]
-        n_contexts = len(self)
-        adj_vector_df: pd.DataFrame = pd.concat(
-            [
-                pd.Series(np.zeros((size), dtype=float), index=index)
-                for _ in range(n_contexts)
-            ],
-            join="outer",
-            axis=1,
-        )
-        graph = self.graph
+        adj_vectors = np.zeros((n_ids * n_ids, len(self)), dtype=float)
         # NOTE: networkx automatically handles directionality (source -> target) here
-        for source, target, data in graph.edges(data=True, keys=False):
-            cid = data["context_index"]
-            id_ = f"{source}-{target}"
-            adj_vector_df.loc[id_, cid] = data[key]
-        return adj_vector_df
+        for source, target, data in self.graph.edges(data=True, keys=False):
+            row = id_index[source] * n_ids + id_index[target]
+            adj_vectors[row, data["context_index"]] = data[key]
+        return pd.DataFrame(adj_vectors, index=index)
 
     def update_thresholds(
         self, interaction_threshold: float = 0.3, pvalue_threshold: float = 0.05
@@ -300,6 +297,16 @@ class NetworkGroup(Collection):
         )
         return new_network
 
+    def _json_bytes(self, pvalue_filter: bool, interaction_filter: bool) -> bytes:
+        """The UTF-8 encoded `JSON` representation of the network group"""
+        nodes = self.nodes
+        links = self._filter_links(
+            pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
+        )
+        contexts = self.contexts
+        network = {"contexts": contexts, "nodes": nodes, "links": links}
+        return _json.dumps(network)
+
     def json(
         self, pvalue_filter: bool = False, interaction_filter: bool = False
     ) -> str:
@@ -320,13 +327,9 @@ class NetworkGroup(Collection):
         str
             The `JSON` string representation of the network
         """
-        nodes = self.nodes
-        links = self._filter_links(
+        return self._json_bytes(
             pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
-        )
-        contexts = self.contexts
-        network = {"contexts": contexts, "nodes": nodes, "links": links}
-        return simplejson.dumps(network, indent=2, sort_keys=True, ignore_nan=True)
+        ).decode("utf-8")
 
     def write(
         self,
@@ -352,17 +355,15 @@ class NetworkGroup(Collection):
             If True will write networks into separate files
             Default value is False
         """
+        path = pathlib.Path(fpath)
         if not split_files:
-            with open(fpath, "w") as fid:
-                fid.write(
-                    self.json(
-                        pvalue_filter=pvalue_filter,
-                        interaction_filter=interaction_filter,
-                    )
+            path.write_bytes(
+                self._json_bytes(
+                    pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
                 )
+            )
         else:
             for cid, network in enumerate(self._networks):
-                path = pathlib.Path(fpath)
                 fname = f"{path.parent}/{cid}_{path.stem}{path.suffix}"
                 network.write(
                     fname,
@@ -444,8 +445,7 @@ class NetworkGroup(Collection):
         if not raw_data and not fpath:
             raise ValueError("Either fpath or raw_data must be specified")
         if not raw_data and fpath:
-            with open(fpath, "r") as fid:
-                data = simplejson.load(fid)
+            data = _json.loads(pathlib.Path(fpath).read_bytes())
         else:
             data: dict = raw_data
         n_networks = len(data["contexts"])
@@ -480,7 +480,7 @@ class NetworkGroup(Collection):
 
     def get_consensus_network(
         self,
-        cids: Optional[List[int]] = None,
+        cids: Optional[Sequence[int]] = None,
         method: str = "simple_voting",
         parameter: float = 0.0,
     ) -> "NetworkGroup":
@@ -489,8 +489,8 @@ class NetworkGroup(Collection):
 
         Parameters:
         -----------
-        cids : Optional[List[int]]
-            The list of context ids that are to be used in the merger
+        cids : Optional[Sequence[int]]
+            The context ids that are to be used in the merger
             Default is None
         method : str, {"simple_voting", "scaled_sum"}
             Default value is simple_voting
@@ -531,8 +531,7 @@ class NetworkGroup(Collection):
 
         # Step1: Filter by "cids" and make copies of graphs
         graphs = []
-        if not cids:
-            cids = list(range(len(self.contexts)))
+        cids = list(cids) if cids else list(self.cids)
         for cid, network in enumerate(self._networks):
             if cid in cids:
                 graphs.append(network.graph.copy())
@@ -560,14 +559,15 @@ class NetworkGroup(Collection):
         # Step 4: Return NetworkGroup object
         return NetworkGroup(new_networks, id_field=self.id_field)
 
-    def combine_pvalues(self, cids: List[int]) -> "NetworkGroup":
+    def combine_pvalues(self, cids: Optional[Sequence[int]] = None) -> "NetworkGroup":
         """
         Combine pvalues of links in the `cids` using Brown's p-value merging method
 
         Parameters:
         -----------
-        cids : List[int]
-            The list of context ids that are to be used in the merger
+        cids : Optional[Sequence[int]]
+            The context ids that are to be used in the merger
+            Default is None which uses all the contexts
 
         Returns
         -------
@@ -576,6 +576,7 @@ class NetworkGroup(Collection):
         """
 
         # Step 1: Obtain the pvalues and weights
+        cids = list(cids) if cids else list(self.cids)
         weight_df: pd.DataFrame = self.get_adjacency_vectors("weight")[cids]
         pvalue_df: pd.DataFrame = self.get_adjacency_vectors("pvalue")[cids]
 
@@ -590,24 +591,17 @@ class NetworkGroup(Collection):
         k = pvalue_df.shape[1]
         expected_value = 2 * k
         # Var[psi] = 4*k + 2 * sum{i<j} (3.263 * corr_ij + 0.710 * corr_ij^2 + 0.027 * corr_ij^3)
-        variance = 4 * k
-        for i in range(1, k):
-            for j in range(i - 1):
-                x_i = weight_df.iloc[:, i].values
-                x_j = weight_df.iloc[:, j].values
-                corr_ij, _ = pearsonr(x_i, x_j)
-                cov_ij_approx = (
-                    3.263 * corr_ij + 0.710 * (corr_ij**2) + 0.027 * (corr_ij**3)
-                )
-                variance += 2 * cov_ij_approx
+        # NOTE: Only the pairs with j < i - 1 contribute to the covariance term
+        corr = np.atleast_2d(np.corrcoef(weight_df.values, rowvar=False))
+        corr_ij = corr[np.tril_indices(k, -2)]
+        cov_approx = 3.263 * corr_ij + 0.710 * (corr_ij**2) + 0.027 * (corr_ij**3)
+        variance = 4 * k + 2 * cov_approx.sum()
         # df = 2 * E[psi]^2 / var[psi]
         degrees_of_freedom = 2 * (expected_value**2) / variance
         # c = var[psi] / (2 * E[psi])
         correction_factor = variance / (2 * expected_value)
         link_ids = pvalue_df.index
-        chi_square = pvalue_df.apply(
-            lambda x: -2.0 * np.log(x).sum() / correction_factor, axis=1
-        )
+        chi_square = -2.0 * np.log(pvalue_df.values).sum(axis=1) / correction_factor
         pvalues_combined = pd.Series(
             data=chi2.sf(chi_square, df=degrees_of_freedom), index=link_ids
         )
@@ -615,8 +609,8 @@ class NetworkGroup(Collection):
         # Step 3: Create new networks
         graphs = [network.graph.copy() for network in self._networks]
         graph_dict = dict(enumerate(graphs))
-        for ind in pvalues_combined.index:
-            for cid, ind_old in self.linkid_revmap[ind]:
+        for ind, old_links in self.linkid_revmap.items():
+            for cid, ind_old in old_links:
                 source_old, target_old = ind_old.split("-")
                 graph_dict[cid].edges[source_old, target_old][
                     "pvalue"
@@ -2,8 +2,9 @@
     Module that handles the execution of subprocesses and parsing of their outputs
 """
 
+import shlex
 import subprocess
-from typing import List, Optional
+from typing import Optional, Tuple
 
 from ..logging import LOG
 
@@ -39,6 +40,7 @@ class Command:
 
     _stdout: Optional[str] = None
     _stderr: Optional[str] = None
+    _log_file: Optional[str] = None
     process: Optional[subprocess.Popen] = None
 
     def __init__(self, cmd: str, profile: str, timeout: int = 1000, **kwargs) -> None:
@@ -48,9 +50,10 @@ class Command:
             raise ValueError("Project must be supplied if profile is sge")
         self.project = project or "None"
         self._cmd = self._build_cmd(cmd)
+        self._cmd_str = shlex.join(self._cmd)
         self._timeout = timeout
 
-    def _build_cmd(self, cmd: str) -> List[str]:
+    def _build_cmd(self, cmd: str) -> Tuple[str, ...]:
         """
         Builds the `cmd` for the current Command instance
 
@@ -61,18 +64,16 @@ class Command:
 
         Returns
         -------
-        str
+        Tuple[str, ...]
             The final command to be executed
         """
-        command: List[str] = []
         if self.profile == "local":
-            pass
+            prefix: Tuple[str, ...] = ()
         elif self.profile == "sge":
-            command.extend(("qsub", "-P", self.project))
+            prefix = ("qsub", "-P", self.project)
         else:
             raise ValueError("Unsupported profile! Choose either 'local' or 'sge'")
-        command.extend(cmd.split(" "))
-        return command
+        return prefix + tuple(shlex.split(cmd))
 
     def __str__(self) -> str:
         return self.cmd
@@ -83,9 +84,11 @@ class Command:
     @property
     def cmd(self) -> str:
         """The command that will be executed"""
-        return " ".join(self._cmd)
+        return self._cmd_str
 
-    def run(self, cwd: Optional[str] = None) -> subprocess.Popen:
+    def run(
+        self, cwd: Optional[str] = None, log_file: Optional[str] = None
+    ) -> subprocess.Popen:
         """
         Executes the command with the correct profile and resources
 
@@ -94,6 +97,10 @@ class Command:
         cwd : str, optional
             The directory in which the command is to be run
             Default is None which uses the current working directory
+        log_file : str, optional
+            The file to which the stdout and stderr of the command are streamed
+            If given, `output` and `error` will be empty
+            Default is None which buffers the stdout and stderr in memory
 
         Returns
         -------
@@ -101,25 +108,58 @@ class Command:
             The exit status of the command
         """
         # QUESTION: Replace this with asyncio.subprocess.create_subprocess_shell
-        self.process = subprocess.Popen(
-            self._cmd,
-            cwd=cwd,
-            shell=False,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        self._stdout = None
+        self._stderr = None
+        self._log_file = log_file
+        if log_file is None:
+            self.process = subprocess.Popen(
+                self._cmd,
+                cwd=cwd,
+                shell=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+        else:
+            # NOTE: The child process keeps its own handle to the file
+            with open(log_file, "wb") as fid:
+                self.process = subprocess.Popen(
+                    self._cmd,
+                    cwd=cwd,
+                    shell=False,
+                    stdout=fid,
+                    stderr=subprocess.STDOUT,
+                )
         return self.process
 
+    def _ensure_finished(self) -> bool:
+        """
+        Wait for the process to complete and store its stdout and stderr
+        `communicate` is only called once per process, later calls reuse the stored output
+
+        Returns
+        -------
+        bool
+            True if the process has been run
+        """
+        if self.process is None:
+            return False
+        if self._stdout is None:
+            stdout, stderr = self.process.communicate(timeout=self._timeout)
+            self._stdout = stdout.decode("utf-8", errors="replace") if stdout else ""
+            self._stderr = stderr.decode("utf-8", errors="replace") if stderr else ""
+        return True
+
     def wait(self) -> None:
         """Wait for the process to complete or terminate"""
-        if self.process:
-            stdout, stderr = self.process.communicate(timeout=self._timeout)
-            self._stderr = stderr.decode("utf-8")
-            self._stdout = stdout.decode("utf-8")
+        self._ensure_finished()
 
     def log(self) -> None:
         """Logs the stdout and stderr of the command execution to the log_file"""
         LOG.logger.info(f"Running command: {self.cmd}")
+        if self._log_file is not None:
+            self.wait()
+            LOG.logger.info(f"[STDOUT] and [STDERR] written to {self._log_file}")
+            return
         LOG.logger.info("-" * 4 + " [STDOUT] " + "-" * 4)
         LOG.logger.success(self.output)
         LOG.logger.info("-" * 4 + " [STDERR] " + "-" * 4)
@@ -139,13 +179,7 @@ class Command:
     @property
     def output(self) -> str:
         """Returns the output generated during execution of the command"""
-        if self._stdout is not None:
-            stdout = self._stdout
-        elif self.process:
-            stdout, stderr = self.process.communicate(timeout=self._timeout)
-            self._stdout = stdout.decode("utf-8")
-            self._stderr = stderr.decode("utf-8")
-        else:
+        if not self._ensure_finished():
             raise NotImplementedError(
                 "Please run the command before requesting output!"
             )
@@ -154,13 +188,7 @@ class Command:
     @property
     def error(self) -> str:
         """Returns the error generated during execution of the command"""
-        if self._stderr is not None:
-            stderr = self._stderr
-        elif self.process:
-            stdout, stderr = self.process.communicate(timeout=self._timeout)
-            self._stdout = stdout.decode("utf-8")
-            self._stderr = stderr.decode("utf-8")
-        else:
+        if not self._ensure_finished():
             raise NotImplementedError(
                 "Please run the command before requesting errors!"
             )
@@ -176,12 +204,14 @@ class Command:
             The new command to be executed
         """
         self._cmd = self._build_cmd(cmd)
+        self._cmd_str = shlex.join(self._cmd)
         if self.process and not self.proc_cmd_sync():
             LOG.logger.warning(
                 "New command differs from executed command. Clearing previous run"
             )
             self._stdout = None
             self._stderr = None
+            self._log_file = None
             self.process = None
 
     @property
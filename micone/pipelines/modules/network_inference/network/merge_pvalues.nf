@@ -13,5 +13,6 @@ process merge_pvalues {
         String task_process = "${task.process}"
         f = getHierarchy(task_process)
         id_field = params.network_inference.network['merge_pvalues']['id_field']
+        ncpus = params.network_inference.network['merge_pvalues']['ncpus']
         template 'network_inference/network/merge_pvalues.py'
 }
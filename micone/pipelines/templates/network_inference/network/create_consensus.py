@@ -20,12 +20,11 @@ def main(
         networks.append(Network.load_json(str(network_file)))
     network_group = NetworkGroup(networks, id_field=id_field)
     pathlib.Path("consensus/").mkdir(parents=True, exist_ok=True)
-    cids = list(range(len(network_group.contexts)))
     filtered_network_group = network_group.filter(
         pvalue_filter=pvalue_filter, interaction_filter=interaction_filter
     )
     consensus_network_group = filtered_network_group.get_consensus_network(
-        cids, method=method, parameter=parameter
+        method=method, parameter=parameter
     )
     consensus_network_group.write("consensus/" + base_name + "_network.json")
 
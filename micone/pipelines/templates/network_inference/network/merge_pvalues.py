@@ -1,19 +1,28 @@
 #!/usr/bin/env python3
 
+import multiprocessing as mp
+import os
 import pathlib
 from typing import List
 
 from micone import Network, NetworkGroup
 
 
-def main(base_name: str, network_files: List[pathlib.Path], id_field: str) -> None:
-    networks: List[Network] = []
-    for network_file in network_files:
-        networks.append(Network.load_json(str(network_file)))
+def load_network(network_file: pathlib.Path) -> Network:
+    return Network.load_bytes(network_file.read_bytes())
+
+
+def main(
+    base_name: str, network_files: List[pathlib.Path], id_field: str, ncpus: int
+) -> None:
+    if ncpus > 1:
+        with mp.Pool(processes=ncpus) as pool:
+            networks: List[Network] = pool.map(load_network, network_files)
+    else:
+        networks = [load_network(network_file) for network_file in network_files]
     network_group = NetworkGroup(networks, id_field=id_field)
     pathlib.Path("merged/").mkdir(parents=True, exist_ok=True)
-    cids = list(range(len(network_group.contexts)))
-    merged_network_group = network_group.combine_pvalues(cids)
+    merged_network_group = network_group.combine_pvalues()
     merged_network_group.write(
         "merged/" + base_name + "_network.json", split_files=True
     )
@@ -22,5 +31,10 @@ def main(base_name: str, network_files: List[pathlib.Path], id_field: str) -> No
 if __name__ == "__main__":
     BASE_NAME = "merged"
     ID_FIELD = "${id_field}"
-    NETWORK_FILES = list(pathlib.Path().glob("*_network.json"))
-    main(BASE_NAME, NETWORK_FILES, ID_FIELD)
+    NETWORK_FILES = [
+        pathlib.Path(entry.path)
+        for entry in os.scandir(".")
+        if entry.name.endswith("_network.json") and entry.is_file()
+    ]
+    NCPUS = int("${ncpus}")
+    main(BASE_NAME, NETWORK_FILES, ID_FIELD, NCPUS)
@@ -3,6 +3,7 @@
 """
 
 import pathlib
+import shlex
 from typing import Iterable, Optional
 
 from ..pipelines import Command
@@ -47,7 +48,10 @@ class Environments:
         if env is None:
             for config, env_name in zip(self.configs, self.env_names):
                 LOG.logger.info(f"Initializing {env_name} environment")
-                cmd_str = f"mamba env create -f {config} -n {env_name}"
+                config_path = shlex.quote(str(config))
+                cmd_str = (
+                    f"mamba env create -f {config_path} -n {shlex.quote(env_name)}"
+                )
                 init_cmd = Command(cmd_str, profile="local", timeout=10000)
                 init_cmd.run()
                 yield init_cmd
@@ -56,7 +60,8 @@ class Environments:
             config = self.configs[ind]
             env_name = self.env_names[ind]
             LOG.logger.info(f"Initializing {env_name} environment")
-            cmd_str = f"mamba env create -f {config} -n {env_name}"
+            config_path = shlex.quote(str(config))
+            cmd_str = f"mamba env create -f {config_path} -n {shlex.quote(env_name)}"
             init_cmd = Command(cmd_str, profile="local", timeout=10000)
             init_cmd.run()
             yield init_cmd
@@ -84,7 +89,7 @@ class Environments:
         else:
             post_scripts = list(ENV_DIR.glob(f"**/{env}/post_install.sh"))
         for script in post_scripts:
-            cmd_str = f"bash {script}"
+            cmd_str = f"bash {shlex.quote(str(script))}"
             LOG.logger.info(
                 f"Running post_install for {script.parent.stem} environment"
             )
@@ -106,7 +111,7 @@ class Environments:
             raise ValueError(f"{env} not a supported environment")
         ind = self.env_names.index(env)
         env_name = self.env_names[ind]
-        cmd_str = f"conda activate {env_name}"
+        cmd_str = f"conda activate {shlex.quote(env_name)}"
         LOG.logger.info(f"Loading {env} environment")
         load_cmd = Command(cmd_str, profile="local", timeout=10000)
         load_cmd.run()
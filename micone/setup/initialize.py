@@ -3,6 +3,7 @@
 """
 
 import pathlib
+import shlex
 from typing import Iterable
 
 from ..pipelines import Command
@@ -42,37 +43,50 @@ class Initialize:
         """
         if workflow in self.workflows:
             LOG.logger.info(f"Initializing {workflow} workflow")
-            nf_micone = output_path / "nf_micone"
+            nf_micone = shlex.quote(str(output_path / "nf_micone"))
+            output_dir = shlex.quote(str(output_path))
             # mkdir -p nf_micone
             cmd1 = Command(f"mkdir -p {nf_micone}", profile="local")
             cmd1.run()
             yield cmd1
             # cp -r "${BASE_DIR}/templates" .
-            cmd2 = Command(f"cp -r {self.templates_dir} {output_path}", profile="local")
+            templates_dir = shlex.quote(str(self.templates_dir))
+            cmd2 = Command(f"cp -r {templates_dir} {output_dir}", profile="local")
             cmd2.run()
             yield cmd2
             # cp -r "${BASE_DIR}/modules" nf_micone
-            cmd3 = Command(f"cp -r {self.modules_dir} {nf_micone}", profile="local")
+            modules_dir = shlex.quote(str(self.modules_dir))
+            cmd3 = Command(f"cp -r {modules_dir} {nf_micone}", profile="local")
             cmd3.run()
             yield cmd3
             # cp -r "${BASE_DIR}/functions" nf_micone
-            cmd4 = Command(f"cp -r {self.functions_dir} {nf_micone}", profile="local")
+            functions_dir = shlex.quote(str(self.functions_dir))
+            cmd4 = Command(f"cp -r {functions_dir} {nf_micone}", profile="local")
             cmd4.run()
             yield cmd4
             # cp -r "${BASE_DIR}/configs" nf_micone
-            cmd5 = Command(f"cp -r {self.configs_dir} {nf_micone}", profile="local")
+            configs_dir = shlex.quote(str(self.configs_dir))
+            cmd5 = Command(f"cp -r {configs_dir} {nf_micone}", profile="local")
             cmd5.run()
             yield cmd5
             # cp -r "${BASE_DIR}/data" nf_micone
-            cmd6 = Command(f"cp -r {self.data_dir} {nf_micone}", profile="local")
+            data_dir = shlex.quote(str(self.data_dir))
+            cmd6 = Command(f"cp -r {data_dir} {nf_micone}", profile="local")
             cmd6.run()
             yield cmd6
             # copy main.nf, nextflow.config, samplesheet.csv, metadata.json, run.sh
             workflow_dir = self.workflows_dir / workflow
-            cmd7 = Command(
-                f"cp {workflow_dir}/main.nf {workflow_dir}/nextflow.config {workflow_dir}/samplesheet.csv {workflow_dir}/metadata.json {workflow_dir}/run.sh {output_path}",
-                profile="local",
+            workflow_files = " ".join(
+                shlex.quote(str(workflow_dir / fname))
+                for fname in (
+                    "main.nf",
+                    "nextflow.config",
+                    "samplesheet.csv",
+                    "metadata.json",
+                    "run.sh",
+                )
             )
+            cmd7 = Command(f"cp {workflow_files} {output_dir}", profile="local")
             cmd7.run()
             yield cmd7
         else:
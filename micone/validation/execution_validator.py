@@ -4,6 +4,7 @@
 
 import ast
 import multiprocessing as mp
+import os
 import pathlib
 import re
 import subprocess
@@ -210,13 +211,14 @@ def validate_expected_results(
         )
     )
     results = {"success": [], "fail": []}
+    # Check the trace file for success
+    trace = process_trace(trace_file)
+    # Check the outputs dir for folder
+    dir_names = {name for _, dirnames, _ in os.walk(output_dir) for name in dirnames}
     for module in modules:
-        # Check the trace file for success
-        trace = process_trace(trace_file)
         module_failures = [module for failure in trace["fail"] if module in failure]
-        # Check the outputs dir for folder
-        module_dirs = [dir for dir in output_dir.glob(f"**/{module}*") if dir.is_dir()]
-        if not module_failures and module_dirs:
+        module_dir = any(name.startswith(module) for name in dir_names)
+        if not module_failures and module_dir:
             results["success"].append(module)
         else:
             results["fail"].append(module)
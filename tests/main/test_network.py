@@ -131,6 +131,23 @@ class TestNetwork:
                 True, True
             )
 
+    def test_load_bytes(self, correlation_files):
+        for (
+            corr_file,
+            pval_file,
+            meta_file,
+            child_file,
+            obsmeta_file,
+            cmeta_file,
+        ) in correlation_files["good"]:
+            network = Network.load_data(
+                corr_file, meta_file, cmeta_file, obsmeta_file, pval_file, child_file
+            )
+            network_loaded = Network.load_bytes(network.json().encode("utf-8"))
+            assert network.metadata == network_loaded.metadata
+            assert network.nodes == network_loaded.nodes
+            assert network.links == network_loaded.links
+
     def test_load_elist(self, network_elist_files):
         for (
             network_file,
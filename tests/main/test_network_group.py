@@ -0,0 +1,118 @@
+"""
+    Module containing tests for the NetworkGroup class
+"""
+
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.stats import chi2, pearsonr
+
+from micone.main import Network, NetworkGroup
+import micone.main.lineage as lineage_module
+
+
+class MockNCBITaxa:
+    """Offline stand-in for `NCBITaxa` that maps phylum P<i> to taxid 1000 + i"""
+
+    def get_name_translator(self, query):
+        return {t: [1000 + int(t[1:])] for t in query if t.startswith("P")}
+
+
+@pytest.fixture
+def network_group(monkeypatch):
+    """Fixture that builds a small `NetworkGroup` with random links"""
+    monkeypatch.setattr(lineage_module, "NCBITaxa", MockNCBITaxa)
+    rng = np.random.default_rng(42)
+    n_nodes, n_networks = 8, 4
+    nodes = [f"otu{i}" for i in range(n_nodes)]
+    obs_metadata = pd.DataFrame(
+        [{"Kingdom": "Bacteria", "Phylum": f"P{i}"} for i in range(n_nodes)],
+        index=nodes,
+    )
+    metadata = {
+        "host": "human",
+        "condition": "healthy",
+        "location": "gut",
+        "experimental_metadata": {},
+        "publication": {"date": "2020-01-01", "authors": [], "pubmed_id": "0"},
+        "description": "test network",
+    }
+    networks = []
+    for _ in range(n_networks):
+        links = [
+            (
+                source,
+                target,
+                {"weight": rng.normal(), "pvalue": rng.uniform(0.001, 1.0)},
+            )
+            for source, target in product(nodes, repeat=2)
+            if source < target and rng.random() < 0.6
+        ]
+        networks.append(
+            Network(
+                nodes,
+                links,
+                dict(metadata),
+                {},
+                obs_metadata,
+                pvalue_correction=None,
+            )
+        )
+    return NetworkGroup(networks)
+
+
+class TestNetworkGroup:
+    """Tests for the NetworkGroup class"""
+
+    def test_get_adjacency_vectors(self, network_group):
+        ids = list(network_group.graph.nodes)
+        index = [f"{id1}-{id2}" for id1, id2 in product(ids, repeat=2)]
+        for key in ["weight", "pvalue"]:
+            expected = pd.DataFrame(
+                np.zeros((len(index), len(network_group))), index=index
+            )
+            for source, target, data in network_group.graph.edges(data=True):
+                expected.loc[f"{source}-{target}", data["context_index"]] = data[key]
+            adj_vectors = network_group.get_adjacency_vectors(key)
+            pd.testing.assert_frame_equal(adj_vectors, expected)
+
+    def test_combine_pvalues(self, network_group):
+        cids = list(network_group.cids)
+        weight_df = network_group.get_adjacency_vectors("weight")[cids]
+        pvalue_df = network_group.get_adjacency_vectors("pvalue")[cids]
+        pvalue_df = pvalue_df.replace(0.0, np.finfo(float).eps)
+        k = len(cids)
+        variance = 4 * k
+        for i in range(1, k):
+            for j in range(i - 1):
+                corr_ij, _ = pearsonr(weight_df.iloc[:, i], weight_df.iloc[:, j])
+                variance += 2 * (
+                    3.263 * corr_ij + 0.710 * (corr_ij**2) + 0.027 * (corr_ij**3)
+                )
+        degrees_of_freedom = 2 * ((2 * k) ** 2) / variance
+        correction_factor = variance / (4 * k)
+        chi_square = -2.0 * np.log(pvalue_df).sum(axis=1) / correction_factor
+        expected = pd.Series(
+            chi2.sf(chi_square, df=degrees_of_freedom), index=pvalue_df.index
+        )
+        merged_network_group = network_group.combine_pvalues(network_group.cids)
+        merged_graphs = [network.graph for network in merged_network_group]
+        for ind, old_links in network_group.linkid_revmap.items():
+            for cid, ind_old in old_links:
+                source, target = ind_old.split("-")
+                pvalue = merged_graphs[cid].edges[source, target]["pvalue"]
+                assert pvalue == pytest.approx(expected[ind])
+
+    def test_get_consensus_network(self, network_group):
+        for method in ["simple_voting", "scaled_sum"]:
+            consensus = network_group.get_consensus_network(
+                network_group.cids, method=method, parameter=0.5
+            )
+            expected = network_group.get_consensus_network(
+                list(network_group.cids), method=method, parameter=0.5
+            )
+            assert len(consensus) == len(network_group)
+            for network, expected_network in zip(consensus, expected):
+                assert set(network.graph.edges) == set(expected_network.graph.edges)
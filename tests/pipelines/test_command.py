@@ -44,6 +44,27 @@ class TestCommand:
         error = command.error
         assert error == "ls: cannot access '&&': No such file or directory\n"
 
+    def test_quoted_args(self):
+        cmd = 'echo "hello  world"'
+        profile = "local"
+        timeout = 1000
+        command = Command(cmd, profile, timeout)
+        command.run()
+        assert command.proc_cmd_sync()
+        assert command.cmd == "echo 'hello  world'"
+        assert command.output == "hello  world\n"
+
+    def test_wait(self):
+        cmd = "uname"
+        profile = "local"
+        timeout = 1000
+        command = Command(cmd, profile, timeout)
+        command.run()
+        command.wait()
+        assert command.status == "success"
+        assert command.output == "Linux\n"
+        assert command.error == ""
+
     def test_log(self, tmpdir):
         cmd = "ls"
         profile = "local"
@@ -53,6 +74,25 @@ class TestCommand:
         command.log()
         assert os.path.exists(LOG.path)
 
+    def test_log_file(self, tmpdir):
+        cmd = "ls &&"
+        profile = "local"
+        timeout = 1000
+        command = Command(cmd, profile, timeout)
+        log_file = str(tmpdir.join("command.log"))
+        command.run(log_file=log_file)
+        command.log()
+        assert command.output == ""
+        assert command.error == ""
+        with open(log_file) as fid:
+            assert fid.read() == "ls: cannot access '&&': No such file or directory\n"
+        command.update("uname")
+        assert command.process is None
+        assert command._log_file is None
+        command.run()
+        command.log()
+        assert command.output == "Linux\n"
+
     def test_profile(self):
         cmd = "ls"
         profile = "sge"
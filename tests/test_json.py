@@ -0,0 +1,56 @@
+"""
+    Module containing tests for the `_json` module
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from micone import _json
+
+DATA = {
+    "nodes": [{"id": "id0", "abundance": None, "children": []}],
+    "links": [
+        {"source": "id0", "target": "id1", "weight": 0.5, "pvalue": np.float64(0.01)},
+        {"source": "id1", "target": "id2", "weight": math.nan, "pvalue": math.inf},
+    ],
+    "interaction_type": "correlation",
+}
+
+
+@pytest.fixture(params=["orjson", "simplejson"])
+def backend(request, monkeypatch):
+    """Fixture that selects the `JSON` backend"""
+    if request.param == "orjson":
+        if _json.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(_json, "orjson", None)
+    return request.param
+
+
+class TestJson:
+    """Tests for the `_json` module"""
+
+    def test_dumps(self, backend):
+        encoded = _json.dumps(DATA)
+        assert isinstance(encoded, bytes)
+        decoded = _json.loads(encoded)
+        assert decoded["nodes"] == DATA["nodes"]
+        assert decoded["links"][0] == {**DATA["links"][0], "pvalue": 0.01}
+        assert decoded["links"][1]["weight"] is None
+        assert decoded["links"][1]["pvalue"] is None
+
+    def test_backends_match(self, monkeypatch):
+        if _json.orjson is None:
+            pytest.skip("orjson is not installed")
+        orjson_encoded = _json.dumps(DATA)
+        monkeypatch.setattr(_json, "orjson", None)
+        simplejson_encoded = _json.dumps(DATA)
+        assert _json.loads(orjson_encoded) == _json.loads(simplejson_encoded)
+
+    def test_loads_nan(self, backend):
+        decoded = _json.loads(b'{"weight": NaN, "pvalue": Infinity}')
+        assert math.isnan(decoded["weight"])
+        assert decoded["pvalue"] == math.inf
@@ -0,0 +1,53 @@
+"""
+    Module containing tests for the execution validator
+"""
+
+import pytest
+
+import micone.validation.execution_validator as execution_validator
+
+MODULES = ["moda", "modb", "modc", "modd"]
+
+
+class MockPopen:
+    """Stand-in for `subprocess.Popen` that emits a flattened nextflow config"""
+
+    def __init__(self, cmd, stdout=None, stderr=None):
+        self.cmd = cmd
+
+    def communicate(self):
+        stdout = f"params.ni.selection = {MODULES[:2]}\nparams.op.selection = {MODULES[2:]}\n"
+        return stdout.encode("utf-8"), b""
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """Fixture that builds a pipeline output directory and mocks nextflow"""
+    monkeypatch.setattr(execution_validator.subprocess, "Popen", MockPopen)
+    monkeypatch.setattr(
+        execution_validator,
+        "process_trace",
+        lambda trace_file: {"success": ["moda_run"], "fail": ["modd_run (1)"]},
+    )
+    output_dir = tmp_path / "outputs"
+    (output_dir / "group" / "nested" / "moda_output").mkdir(parents=True)
+    (output_dir / "group" / "modb.txt").write_text("")
+    (output_dir / "modd").mkdir()
+    return output_dir
+
+
+class TestExecutionValidator:
+    """Tests for the execution validator functions"""
+
+    def test_validate_expected_results(self, output_dir, tmp_path):
+        results = execution_validator.validate_expected_results(
+            tmp_path, tmp_path / "trace.txt", output_dir
+        )
+        assert results == {"success": ["moda"], "fail": ["modb", "modc", "modd"]}
+        # Matches the behaviour of a recursive glob for each module
+        trace = execution_validator.process_trace(tmp_path / "trace.txt")
+        for module in MODULES:
+            module_failures = [f for f in trace["fail"] if module in f]
+            module_dirs = [d for d in output_dir.glob(f"**/{module}*") if d.is_dir()]
+            expected = "success" if not module_failures and module_dirs else "fail"
+            assert module in results[expected]